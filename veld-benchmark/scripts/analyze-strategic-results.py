@@ -4,324 +4,505 @@ Strategic Benchmark Results Analyzer
 Analyzes Veld Framework strategic validation benchmark results and generates insights.
 """
 
+import io
 import json
-import sys
+import operator
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import BinaryIO, Dict, List, Any, Callable, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+try:
+    import ijson  # Streaming parser, avoids materializing raw iteration samples
+    JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    JSON_ERRORS = (json.JSONDecodeError,)
+
+try:
+    import orjson  # Faster whole-file parsing when streaming is unavailable
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick  # Matches all category needles in one scan per name
+except ImportError:
+    ahocorasick = None
+
+try:
+    import numpy as np  # Vectorized statistics over JMH rawData samples
+except ImportError:
+    np = None
+
+REPORT_HEADER = "# VELD FRAMEWORK - STRATEGIC VALIDATION REPORT\n" + "=" * 50 + "\n"
+
+class RawDistribution(NamedTuple):
+    """Distribution of a benchmark's raw iteration samples."""
+    mean: float
+    minimum: float
+    maximum: float
+    p50: float
+    p99: float
+
+def summarize_samples_loop(samples) -> Tuple[float, float, float]:
+    """Mean, min and max of a flat float64 array in one explicit loop.
+
+    Like numpy, a NaN sample makes min and max NaN as well.
+    """
+    n = samples.shape[0]
+    total = 0.0
+    low = samples[0]
+    high = samples[0]
+    has_nan = False
+    for i in range(n):
+        v = samples[i]
+        total += v
+        low = min(low, v)
+        high = max(high, v)
+        has_nan = has_nan or v != v
+    if has_nan:
+        return total / n, np.nan, np.nan
+    return total / n, low, high
+
+# Below this many samples, importing and compiling numba costs more than it saves
+NUMBA_MIN_SAMPLES = 100_000
+
+@lru_cache(maxsize=None)
+def compiled_summary():
+    """Compile summarize_samples_loop with numba on first use, or None without numba."""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    # No fastmath: it assumes no NaNs, which would leave min/max undefined.
+    # No on-disk cache: entries written by a dynamically loaded copy of this
+    # module break every later process that loads them.
+    return njit(summarize_samples_loop)
+
+def summarize_samples(samples) -> Tuple[float, float, float]:
+    """Mean, min and max of a flat float64 array.
+
+    Large arrays go through the numba kernel when numba is installed,
+    everything else through numpy reductions.
+    """
+    if samples.shape[0] >= NUMBA_MIN_SAMPLES:
+        kernel = compiled_summary()
+        if kernel is not None:
+            return kernel(samples)
+    return samples.mean(), samples.min(), samples.max()
+
+@lru_cache(maxsize=64)
+def titlecase(key: str) -> str:
+    """Turn a snake_case key into a report heading, e.g. 'load_factor' -> 'Load Factor'."""
+    return key.replace('_', ' ').title()
+
+# Result fields that are not rendered in the detailed analysis section
+REPORT_SKIP_KEYS = frozenset(('analysis',))
+
+def format_detail(key: str, value: Any) -> str:
+    """Format a result field as a Markdown detail line."""
+    if isinstance(value, float):
+        return f"**{titlecase(key)}:** {value:.3f}"
+    return f"**{titlecase(key)}:** {value}"
+
+def starts_with_array(f: BinaryIO) -> bool:
+    """Peek past leading whitespace for a top-level '[', then rewind the file."""
+    while True:
+        chunk = f.read(64)
+        head = chunk.lstrip()
+        if head or not chunk:
+            f.seek(0)
+            return head[:1] == b'['
+
+def benchmark_records(data: Any) -> List[Dict[str, Any]]:
+    """Extract the benchmark records from a fully parsed results document."""
+    if isinstance(data, dict):
+        data = data.get('benchmarks', [])
+    return data if isinstance(data, list) else []
+
+@lru_cache(maxsize=None)
+def needle_automaton(needles: Tuple[str, ...]):
+    """Build an Aho-Corasick automaton tagging each needle with itself."""
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return automaton
+
+def collect_matches(benchmarks: Iterable[Tuple[str, Dict[str, Any]]],
+                    needles: Tuple[str, ...],
+                    last_match: bool = False) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+    """Map each needle to the first (or last) benchmark whose name contains it.
+
+    Benchmarks are (name, primaryMetric) pairs as yielded by load_results,
+    and each needle maps to the matching pair. JMH repeats a benchmark name
+    once per @Param combination, so last_match decides which record wins.
+
+    All needles are filled in a single pass. For first matches, matching stops
+    once every needle is filled. The stream is always consumed to the end so
+    that a corrupt file is rejected the same way by every parser. Uses
+    pyahocorasick when available and plain substring tests otherwise.
+    """
+    matches = {}
+    if ahocorasick is not None:
+        automaton_iter = needle_automaton(needles).iter
+        for name, metric in benchmarks:
+            if not last_match and len(matches) == len(needles):
+                continue
+            for _, needle in automaton_iter(name):
+                if last_match or needle not in matches:
+                    matches[needle] = (name, metric)
+                    break
+        return matches
+        
+    pending = list(needles)
+    for name, metric in benchmarks:
+        for needle in needles if last_match else pending:
+            if needle in name:
+                matches[needle] = (name, metric)
+                if not last_match:
+                    pending.remove(needle)
+                break
+    return matches
+
+class CategoryResult:
+    """Base of the per-category results; analyze() decides passed and status.
+
+    Slots are declared by hand because dataclass(slots=True) needs Python 3.10,
+    which also rules out class-level defaults on the slotted fields.
+    """
+    __slots__ = ('passed', 'status')
+
+    def __post_init__(self):
+        self.passed = False
+        self.status = 'FAIL'
+
+@dataclass
+class ScalabilityResult(CategoryResult):
+    __slots__ = ('concurrent_avg_ns', 'single_avg_ns', 'efficiency_ratio', 'efficiency_percentage')
+    concurrent_avg_ns: float
+    single_avg_ns: float
+    efficiency_ratio: float
+    efficiency_percentage: float
+
+@dataclass
+class ContentionResult(CategoryResult):
+    __slots__ = ('avg_lazy_lookup_ns', 'threads')
+    avg_lazy_lookup_ns: float
+    threads: int
+
+@dataclass
+class MemoryResult(CategoryResult):
+    __slots__ = ('memory_overhead_mb', 'threadlocal_cache_mb', 'total_memory_mb')
+    memory_overhead_mb: float
+    threadlocal_cache_mb: float
+    total_memory_mb: float
+
+@dataclass
+class HashCollisionResult(CategoryResult):
+    __slots__ = ('worst_case_lookup_ns', 'analysis')
+    worst_case_lookup_ns: float
+    analysis: str
+
+@dataclass
+class EfficiencyResult(CategoryResult):
+    __slots__ = ('concurrent_efficiency_ns', 'single_efficiency_ns', 'efficiency_ratio', 'efficiency_percentage')
+    concurrent_efficiency_ns: float
+    single_efficiency_ns: float
+    efficiency_ratio: float
+    efficiency_percentage: float
+
+@dataclass
+class LoadFactorResult(CategoryResult):
+    __slots__ = ('current_load_factor', 'target_load_factor', 'analysis')
+    current_load_factor: float
+    target_load_factor: float
+    analysis: str
+
+class AnalysisSpec(NamedTuple):
+    """Describes how one category is scored from its benchmark results."""
+    needles: Tuple[str, ...]  # Benchmark name substrings, passed to evaluate in order
+    evaluate: Callable[..., CategoryResult]  # Builds the result from the scores
+    metric: str  # Result field compared against the threshold
+    threshold: float
+    compare: Callable[[float, float], bool]
+    partial: bool = False  # Whether missing needles may default to 0
+    last_match: bool = False  # Whether the last matching record wins over the first
+
+def evaluate_scalability(concurrent_avg: float, single_avg: float) -> ScalabilityResult:
+    """Calculate the concurrent lookup efficiency ratio."""
+    efficiency = concurrent_avg * (0.25 / single_avg)  # 4 threads
+    return ScalabilityResult(concurrent_avg, single_avg, efficiency, efficiency * 100)
+
+def evaluate_contention(avg_time: float) -> ContentionResult:
+    """Report lazy initialization latency with 8 threads."""
+    return ContentionResult(avg_time, 8)
+
+def evaluate_memory_overhead(memory_bytes: float, cache_bytes: float) -> MemoryResult:
+    """Convert memory and ThreadLocal cache overhead to megabytes."""
+    memory_mb = memory_bytes / (1024 * 1024)
+    cache_mb = cache_bytes / (1024 * 1024)
+    return MemoryResult(memory_mb, cache_mb, memory_mb + cache_mb)
+
+def evaluate_hash_collision(avg_time: float) -> HashCollisionResult:
+    """Report worst-case lookup latency under hash collisions."""
+    return HashCollisionResult(
+        avg_time,
+        'Tests current O(n) array search with clustered access patterns'
+    )
+
+def evaluate_efficiency(concurrent_avg: float, single_avg: float) -> EfficiencyResult:
+    """Calculate the efficiency ratio benchmark result."""
+    efficiency = concurrent_avg * (0.25 / single_avg)  # 4 threads
+    return EfficiencyResult(concurrent_avg, single_avg, efficiency, efficiency * 100)
+
+def evaluate_load_factor(load_factor: float) -> LoadFactorResult:
+    """Compare the measured load factor with the power-of-2 target."""
+    return LoadFactorResult(
+        load_factor,
+        0.7,
+        f'Current: {load_factor:.2f}, Target: 0.70 (Power-of-2 capacity)'
+    )
+
+ANALYSIS_SPECS = {
+    # Target: >80% efficiency
+    'scalability': AnalysisSpec(('concurrentLookup', 'singleThreadLookup'), evaluate_scalability,
+                                'efficiency_ratio', 0.8, operator.gt, last_match=True),
+    # Target: <1μs per lookup
+    'contention': AnalysisSpec(('getLazyService',), evaluate_contention,
+                               'avg_lazy_lookup_ns', 1000, operator.lt),
+    # Target: <10MB overhead
+    'memory': AnalysisSpec(('memoryOverhead', 'threadLocalCacheBehavior'), evaluate_memory_overhead,
+                           'total_memory_mb', 10, operator.lt, partial=True, last_match=True),
+    # Target: <500ns worst case
+    'hash_collision': AnalysisSpec(('worstCaseHashCollision',), evaluate_hash_collision,
+                                   'worst_case_lookup_ns', 500, operator.lt),
+    # Target: >75% efficiency
+    'efficiency': AnalysisSpec(('concurrentEfficiency', 'singleEfficiency'), evaluate_efficiency,
+                               'efficiency_ratio', 0.75, operator.gt, last_match=True),
+    'load_factor': AnalysisSpec(('loadFactorValidation',), evaluate_load_factor,
+                                'current_load_factor', 0.7, operator.lt)
+}
 
 class StrategicBenchmarkAnalyzer:
     def __init__(self):
         self.results = {}
         self.insights = []
+        self.total_passed = 0
+        self.total_tests = 0
+        self.raw_stats = {}  # Benchmark name -> RawDistribution from rawData
         
-    def load_results(self, filepath: str) -> Dict[str, Any]:
-        """Load benchmark results from JSON file."""
-        try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"Warning: {filepath} not found")
-            return {}
-        except json.JSONDecodeError:
-            print(f"Warning: Invalid JSON in {filepath}")
-            return {}
-
-    def analyze_scalability(self, results: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze scalability performance."""
-        if 'benchmarks' not in results:
-            return {}
-            
-        benchmarks = results['benchmarks']
-        concurrent_data = None
-        single_data = None
-        
-        # Find concurrent and single thread results
-        for bench in benchmarks:
-            if 'concurrentLookup' in bench['benchmark']:
-                concurrent_data = bench
-            elif 'singleThreadLookup' in bench['benchmark']:
-                single_data = bench
-                
-        if not concurrent_data or not single_data:
-            return {}
-            
-        # Calculate efficiency ratio
-        concurrent_avg = concurrent_data['primaryMetric']['score']
-        single_avg = single_data['primaryMetric']['score']
-        efficiency = concurrent_avg / (single_avg * 4)  # 4 threads
-        
-        return {
-            'concurrent_avg_ns': concurrent_avg,
-            'single_avg_ns': single_avg,
-            'efficiency_ratio': efficiency,
-            'efficiency_percentage': efficiency * 100,
-            'passed': efficiency > 0.8,  # Target: >80% efficiency
-            'status': 'PASS' if efficiency > 0.8 else 'FAIL'
-        }
-
-    def analyze_contention(self, results: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze lazy initialization contention."""
-        if 'benchmarks' not in results:
-            return {}
-            
-        benchmarks = results['benchmarks']
-        lazy_data = None
-        
-        for bench in benchmarks:
-            if 'getLazyService' in bench['benchmark']:
-                lazy_data = bench
-                break
-                
-        if not lazy_data:
-            return {}
-            
-        avg_time = lazy_data['primaryMetric']['score']
-        
-        # Analyze performance with 8 threads
-        return {
-            'avg_lazy_lookup_ns': avg_time,
-            'threads': 8,
-            'passed': avg_time < 1000,  # Target: <1μs per lookup
-            'status': 'PASS' if avg_time < 1000 else 'FAIL'
-        }
-
-    def analyze_memory_overhead(self, results: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze memory overhead and ThreadLocal behavior."""
-        if 'benchmarks' not in results:
-            return {}
-            
-        benchmarks = results['benchmarks']
-        memory_data = None
-        cache_data = None
-        
-        for bench in benchmarks:
-            if 'memoryOverhead' in bench['benchmark']:
-                memory_data = bench
-            elif 'threadLocalCacheBehavior' in bench['benchmark']:
-                cache_data = bench
-                
-        memory_mb = 0
-        cache_mb = 0
-        
-        if memory_data:
-            memory_mb = memory_data['primaryMetric']['score'] / (1024 * 1024)
-            
-        if cache_data:
-            cache_mb = cache_data['primaryMetric']['score'] / (1024 * 1024)
-            
-        return {
-            'memory_overhead_mb': memory_mb,
-            'threadlocal_cache_mb': cache_mb,
-            'total_memory_mb': memory_mb + cache_mb,
-            'passed': (memory_mb + cache_mb) < 10,  # Target: <10MB overhead
-            'status': 'PASS' if (memory_mb + cache_mb) < 10 else 'FAIL'
-        }
-
-    def analyze_hash_collision(self, results: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze hash collision impact."""
-        if 'benchmarks' not in results:
-            return {}
-            
-        benchmarks = results['benchmarks']
-        collision_data = None
-        
-        for bench in benchmarks:
-            if 'worstCaseHashCollision' in bench['benchmark']:
-                collision_data = bench
-                break
-                
-        if not collision_data:
-            return {}
-            
-        avg_time = collision_data['primaryMetric']['score']
-        
-        return {
-            'worst_case_lookup_ns': avg_time,
-            'analysis': 'Tests current O(n) array search with clustered access patterns',
-            'passed': avg_time < 500,  # Target: <500ns worst case
-            'status': 'PASS' if avg_time < 500 else 'FAIL'
-        }
-
-    def analyze_efficiency(self, results: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze efficiency ratio calculation."""
-        if 'benchmarks' not in results:
-            return {}
-            
-        benchmarks = results['benchmarks']
-        concurrent_eff = None
-        single_eff = None
-        
-        for bench in benchmarks:
-            if 'concurrentEfficiency' in bench['benchmark']:
-                concurrent_eff = bench
-            elif 'singleEfficiency' in bench['benchmark']:
-                single_eff = bench
-                
-        if not concurrent_eff or not single_eff:
-            return {}
-            
-        concurrent_avg = concurrent_eff['primaryMetric']['score']
-        single_avg = single_eff['primaryMetric']['score']
-        efficiency = concurrent_avg / (single_avg * 4)
-        
-        return {
-            'concurrent_efficiency_ns': concurrent_avg,
-            'single_efficiency_ns': single_avg,
-            'efficiency_ratio': efficiency,
-            'efficiency_percentage': efficiency * 100,
-            'passed': efficiency > 0.75,  # Target: >75% efficiency
-            'status': 'PASS' if efficiency > 0.75 else 'FAIL'
-        }
-
-    def analyze_load_factor(self, results: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze load factor validation."""
-        if 'benchmarks' not in results:
-            return {}
+    def load_results(self, filepath: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Lazily yield benchmark name and primaryMetric from a JSON results file.
+
+        Accepts both the bare array written by JMH '-rf json' and an object
+        wrapping that array under 'benchmarks'.
+
+        Corrupt JSON raises one of JSON_ERRORS once the stream reaches it.
+        """
+        with open(filepath, 'rb') as f:
+            if ijson is not None:
+                prefix = 'item' if starts_with_array(f) else 'benchmarks.item'
+                benchmarks = ijson.items(f, prefix, use_float=True)
+            elif orjson is not None:
+                benchmarks = benchmark_records(orjson.loads(f.read()))
+            else:
+                benchmarks = benchmark_records(json.load(f))
+            for bench in benchmarks:
+                yield bench['benchmark'], bench['primaryMetric']
+
+    def analyze_raw_distribution(self, raw_data: List[List[float]]) -> Optional[RawDistribution]:
+        """Summarize all forks' iteration samples for one benchmark."""
+        samples = np.concatenate([np.asarray(fork, dtype=np.float64) for fork in raw_data])
+        if samples.size == 0:
+            return None
             
-        benchmarks = results['benchmarks']
-        load_factor_data = None
+        mean, low, high = summarize_samples(samples)
+        p50, p99 = np.percentile(samples, (50, 99))
+        return RawDistribution(float(mean), float(low), float(high), float(p50), float(p99))
+
+    def benchmark_score(self, name: str, metric: Dict[str, Any]) -> float:
+        """Score a matched benchmark from its rawData when possible.
+
+        When numpy is available and rawData is present, the score is the mean
+        of the raw samples and the distribution is recorded in raw_stats.
+        raw_stats is shared by the worker threads, but each category writes
+        only its own benchmark names and a single dict store is atomic.
+        """
+        raw_data = metric.get('rawData')
+        stats = self.analyze_raw_distribution(raw_data) if np is not None and raw_data else None
+        if stats is None:
+            return metric['score']
+        self.raw_stats[name] = stats
+        return stats.mean
+
+    def analyze(self, benchmarks: Iterable[Tuple[str, Dict[str, Any]]], spec: AnalysisSpec) -> Optional[CategoryResult]:
+        """Analyze one category's benchmarks against its spec."""
+        matches = collect_matches(benchmarks, spec.needles, spec.last_match)
         
-        for bench in benchmarks:
-            if 'loadFactorValidation' in bench['benchmark']:
-                load_factor_data = bench
-                break
-                
-        if not load_factor_data:
-            return {}
+        if not matches or (not spec.partial and len(matches) < len(spec.needles)):
+            return None
             
-        load_factor = load_factor_data['primaryMetric']['score']
-        
-        return {
-            'current_load_factor': load_factor,
-            'target_load_factor': 0.7,
-            'analysis': f'Current: {load_factor:.2f}, Target: 0.70 (Power-of-2 capacity)',
-            'passed': load_factor < 0.7,
-            'status': 'PASS' if load_factor < 0.7 else 'FAIL'
-        }
-
-    def generate_insights(self, analysis_results: Dict[str, Any]):
+        scores = {needle: self.benchmark_score(name, metric) for needle, (name, metric) in matches.items()}
+        result = spec.evaluate(*(scores.get(needle, 0) for needle in spec.needles))
+        result.passed = spec.compare(getattr(result, spec.metric), spec.threshold)
+        result.status = 'PASS' if result.passed else 'FAIL'
+        return result
+
+    def results_problem(self, filepath: str) -> Optional[str]:
+        """Explain why a results file can't be analyzed, checked without opening it."""
+        try:
+            size = os.stat(filepath).st_size
+        except FileNotFoundError:
+            return f"{filepath} not found"
+        if size == 0:
+            return f"{filepath} is empty"
+        return None
+
+    def _analyze_one(self, category: str, filepath: str) -> Tuple[Optional[CategoryResult], Optional[str]]:
+        """Load a single results file and run its category analyzer.
+
+        Returns the result and a warning instead of printing, so that
+        run_analysis can report progress in category order.
+        """
+        # Partial benchmark runs leave files missing or empty, skip those before opening
+        problem = self.results_problem(filepath)
+        if problem:
+            return None, problem
+        try:
+            return self.analyze(self.load_results(filepath), ANALYSIS_SPECS[category]), None
+        except JSON_ERRORS:
+            # Scores matched before the damage are discarded, whichever parser is in use
+            return None, f"Invalid JSON in {filepath}"
+
+    def generate_insights(self, analysis_results: Dict[str, Optional[CategoryResult]]):
         """Generate strategic insights from analysis results."""
+        append = self.insights.append
         
         # Scalability insights
-        if 'scalability' in analysis_results:
-            scal = analysis_results['scalability']
-            if scal.get('passed', False):
-                self.insights.append(f"✅ SCALABILITY: Excellent efficiency at {scal['efficiency_percentage']:.1f}%")
+        scal = analysis_results.get('scalability')
+        if scal:
+            if scal.passed:
+                append(f"✅ SCALABILITY: Excellent efficiency at {scal.efficiency_percentage:.1f}%")
             else:
-                self.insights.append(f"⚠️ SCALABILITY: Poor efficiency at {scal['efficiency_percentage']:.1f}% (target: >80%)")
+                append(f"⚠️ SCALABILITY: Poor efficiency at {scal.efficiency_percentage:.1f}% (target: >80%)")
                 
         # Contention insights
-        if 'contention' in analysis_results:
-            cont = analysis_results['contention']
-            if cont.get('passed', False):
-                self.insights.append(f"✅ CONTENTION: Low contention latency {cont['avg_lazy_lookup_ns']:.0f}ns")
+        cont = analysis_results.get('contention')
+        if cont:
+            if cont.passed:
+                append(f"✅ CONTENTION: Low contention latency {cont.avg_lazy_lookup_ns:.0f}ns")
             else:
-                self.insights.append(f"⚠️ CONTENTION: High contention latency {cont['avg_lazy_lookup_ns']:.0f}ns")
+                append(f"⚠️ CONTENTION: High contention latency {cont.avg_lazy_lookup_ns:.0f}ns")
                 
         # Memory insights
-        if 'memory' in analysis_results:
-            mem = analysis_results['memory']
-            if mem.get('passed', False):
-                self.insights.append(f"✅ MEMORY: Low overhead {mem['total_memory_mb']:.1f}MB")
+        mem = analysis_results.get('memory')
+        if mem:
+            if mem.passed:
+                append(f"✅ MEMORY: Low overhead {mem.total_memory_mb:.1f}MB")
             else:
-                self.insights.append(f"⚠️ MEMORY: High overhead {mem['total_memory_mb']:.1f}MB")
+                append(f"⚠️ MEMORY: High overhead {mem.total_memory_mb:.1f}MB")
                 
         # Hash collision insights
-        if 'hash_collision' in analysis_results:
-            hash_col = analysis_results['hash_collision']
-            if hash_col.get('passed', False):
-                self.insights.append(f"✅ HASH COLLISION: Acceptable worst-case {hash_col['worst_case_lookup_ns']:.0f}ns")
+        hash_col = analysis_results.get('hash_collision')
+        if hash_col:
+            if hash_col.passed:
+                append(f"✅ HASH COLLISION: Acceptable worst-case {hash_col.worst_case_lookup_ns:.0f}ns")
             else:
-                self.insights.append(f"⚠️ HASH COLLISION: Poor worst-case {hash_col['worst_case_lookup_ns']:.0f}ns")
+                append(f"⚠️ HASH COLLISION: Poor worst-case {hash_col.worst_case_lookup_ns:.0f}ns")
                 
         # Overall recommendations
-        total_passed = sum(1 for result in analysis_results.values() if result.get('passed', False))
-        total_tests = len([r for r in analysis_results.values() if r])
+        total_passed = self.total_passed
+        total_tests = self.total_tests
         
-        self.insights.append(f"\n📊 OVERALL: {total_passed}/{total_tests} tests passed")
+        append(f"\n📊 OVERALL: {total_passed}/{total_tests} tests passed")
         
         if total_passed == total_tests:
-            self.insights.append("🎉 ALL STRATEGIC TESTS PASSED - Framework ready for production!")
+            append("🎉 ALL STRATEGIC TESTS PASSED - Framework ready for production!")
         elif total_passed >= total_tests * 0.8:
-            self.insights.append("✅ MOSTLY READY - Minor optimizations recommended")
+            append("✅ MOSTLY READY - Minor optimizations recommended")
         else:
-            self.insights.append("⚠️ NEEDS OPTIMIZATION - Several critical issues found")
+            append("⚠️ NEEDS OPTIMIZATION - Several critical issues found")
 
-    def generate_report(self, analysis_results: Dict[str, Any]) -> str:
+    def generate_report(self, analysis_results: Dict[str, Optional[CategoryResult]]) -> str:
         """Generate comprehensive analysis report."""
         
-        report = []
-        report.append("# VELD FRAMEWORK - STRATEGIC VALIDATION REPORT")
-        report.append("=" * 50)
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w(REPORT_HEADER)
+        w(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
         
         # Executive Summary
-        report.append("## EXECUTIVE SUMMARY")
-        report.append("")
-        total_passed = sum(1 for result in analysis_results.values() if result.get('passed', False))
-        total_tests = len([r for r in analysis_results.values() if r])
-        report.append(f"**Tests Passed:** {total_passed}/{total_tests} ({total_passed/total_tests*100:.1f}%)")
-        report.append("")
+        w("## EXECUTIVE SUMMARY\n\n")
+        total_passed = self.total_passed
+        total_tests = self.total_tests
+        w(f"**Tests Passed:** {total_passed}/{total_tests} ({total_passed/total_tests*100:.1f}%)\n\n")
         
         # Detailed Results
-        report.append("## DETAILED ANALYSIS")
-        report.append("")
+        w("## DETAILED ANALYSIS\n\n")
         
         for category, results in analysis_results.items():
             if not results:
                 continue
                 
-            report.append(f"### {category.replace('_', ' ').title()}")
-            report.append("")
+            w(f"### {titlecase(category)}\n\n")
             
-            for key, value in results.items():
-                if key == 'analysis':
+            for field in fields(results):
+                key = field.name
+                if key in REPORT_SKIP_KEYS:
                     continue
-                elif key == 'passed':
-                    continue
-                elif key == 'status':
-                    report.append(f"**Status:** {value}")
-                elif isinstance(value, float):
-                    report.append(f"**{key.replace('_', ' ').title()}:** {value:.3f}")
-                else:
-                    report.append(f"**{key.replace('_', ' ').title()}:** {value}")
-            report.append("")
+                value = getattr(results, key)
+                w(format_detail(key, value))
+                w("\n")
+            w(format_detail('status', results.status))
+            w("\n\n")
+        
+        # Raw sample distribution, only when JMH rawData was analyzed
+        if self.raw_stats:
+            w("## RAW DATA DISTRIBUTION\n\n")
+            for name in sorted(self.raw_stats):
+                stats = self.raw_stats[name]
+                w(f"**{name.rsplit('.', 1)[-1]}:** mean {stats.mean:.3f}, min {stats.minimum:.3f}, "
+                  f"max {stats.maximum:.3f}, p50 {stats.p50:.3f}, p99 {stats.p99:.3f}\n")
+            w("\n")
         
         # Insights and Recommendations
-        report.append("## STRATEGIC INSIGHTS")
-        report.append("")
+        w("## STRATEGIC INSIGHTS\n\n")
         for insight in self.insights:
-            report.append(insight)
-        report.append("")
+            w(insight)
+            w("\n")
+        w("\n")
         
         # Technical Recommendations
-        report.append("## TECHNICAL RECOMMENDATIONS")
-        report.append("")
+        w("## TECHNICAL RECOMMENDATIONS\n\n")
+        passed = {category: bool(result and result.passed) for category, result in analysis_results.items()}
         
-        if not analysis_results.get('scalability', {}).get('passed', False):
-            report.append("- **Scalability:** Consider implementing hash-based lookup for better concurrent performance")
+        if not passed.get('scalability'):
+            w("- **Scalability:** Consider implementing hash-based lookup for better concurrent performance\n")
             
-        if not analysis_results.get('hash_collision', {}).get('passed', False):
-            report.append("- **Hash Collision:** Current O(n) array search may degrade with 20+ services")
+        if not passed.get('hash_collision'):
+            w("- **Hash Collision:** Current O(n) array search may degrade with 20+ services\n")
             
-        if not analysis_results.get('memory', {}).get('passed', False):
-            report.append("- **Memory:** High memory overhead detected - investigate ThreadLocal cache behavior")
+        if not passed.get('memory'):
+            w("- **Memory:** High memory overhead detected - investigate ThreadLocal cache behavior\n")
             
-        if not analysis_results.get('load_factor', {}).get('passed', False):
-            report.append("- **Load Factor:** Consider power-of-2 array capacity for future hash implementation")
+        if not passed.get('load_factor'):
+            w("- **Load Factor:** Consider power-of-2 array capacity for future hash implementation\n")
             
-        report.append("")
-        report.append("## CONCLUSION")
-        report.append("")
-        report.append("This strategic validation provides critical insights into Veld Framework's")
-        report.append("performance characteristics and identifies areas for optimization.")
+        w("\n## CONCLUSION\n\n")
+        w("This strategic validation provides critical insights into Veld Framework's\n")
+        w("performance characteristics and identifies areas for optimization.\n")
         
-        return "\n".join(report)
+        return buf.getvalue()
 
     def run_analysis(self, results_dir: str = "results"):
-        """Run complete analysis on all benchmark results."""
+        """Run complete analysis on all benchmark results.
+
+        Returns the per-category results with the passed and total test counts.
+        """
         
         # Load all result files
         result_files = [
@@ -333,24 +514,23 @@ class StrategicBenchmarkAnalyzer:
             ("load_factor", f"{results_dir}/load-factor-results.json")
         ]
         
-        analysis_results = {}
+        # Analyzers are independent and I/O bound, so overlap the file reads
+        with ThreadPoolExecutor(max_workers=len(result_files)) as executor:
+            futures = [
+                (category, executor.submit(self._analyze_one, category, filepath))
+                for category, filepath in result_files
+            ]
+            analysis_results = {}
+            # Report progress as each result is collected, so warnings follow their category
+            for category, future in futures:
+                print(f"📊 Analyzing {category} results...")
+                result, warning = future.result()
+                if warning:
+                    print(f"Warning: {warning}")
+                analysis_results[category] = result
         
-        for category, filepath in result_files:
-            print(f"📊 Analyzing {category} results...")
-            raw_results = self.load_results(filepath)
-            
-            if category == "scalability":
-                analysis_results[category] = self.analyze_scalability(raw_results)
-            elif category == "contention":
-                analysis_results[category] = self.analyze_contention(raw_results)
-            elif category == "memory":
-                analysis_results[category] = self.analyze_memory_overhead(raw_results)
-            elif category == "hash_collision":
-                analysis_results[category] = self.analyze_hash_collision(raw_results)
-            elif category == "efficiency":
-                analysis_results[category] = self.analyze_efficiency(raw_results)
-            elif category == "load_factor":
-                analysis_results[category] = self.analyze_load_factor(raw_results)
+        self.total_passed = sum(1 for result in analysis_results.values() if result and result.passed)
+        self.total_tests = sum(1 for result in analysis_results.values() if result)
         
         # Generate insights and report
         self.generate_insights(analysis_results)
@@ -358,29 +538,25 @@ class StrategicBenchmarkAnalyzer:
         
         # Save report
         report_file = f"{results_dir}/strategic-analysis-report.md"
-        with open(report_file, 'w') as f:
-            f.write(report)
+        with open(report_file, 'wb') as f:
+            f.write(report.encode('utf-8'))
             
-        print(f"\n📋 Analysis report saved to: {report_file}")
-        print("\n" + "="*50)
-        print("STRATEGIC VALIDATION SUMMARY")
-        print("="*50)
-        for insight in self.insights:
-            print(insight)
+        banner = "=" * 50
+        sys.stdout.write(
+            f"\n📋 Analysis report saved to: {report_file}\n"
+            f"\n{banner}\nSTRATEGIC VALIDATION SUMMARY\n{banner}\n"
+            + "\n".join(self.insights) + "\n"
+        )
             
-        return analysis_results
+        return analysis_results, self.total_passed, self.total_tests
 
 if __name__ == "__main__":
     analyzer = StrategicBenchmarkAnalyzer()
-    results = analyzer.run_analysis()
+    results, passed, total = analyzer.run_analysis()
     
     # Exit with error code if any critical tests failed
-    critical_failures = sum(1 for result in results.values() 
-                           if result and not result.get('passed', False))
-    
-    if critical_failures > 0:
-        print(f"\n❌ {critical_failures} critical tests failed")
-        sys.exit(1)
+    if passed < total:
+        print(f"\n❌ {total - passed} critical tests failed")
     else:
         print(f"\n✅ All strategic tests passed!")
-        sys.exit(0)
\ No newline at end of file
+    raise SystemExit(0 if passed == total else 1)
\ No newline at end of file
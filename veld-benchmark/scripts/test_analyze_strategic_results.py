@@ -0,0 +1,143 @@
+"""
+Checks that analyze-strategic-results.py gives the same verdicts and report
+whichever optional dependencies are installed.
+"""
+
+import importlib.util
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).with_name('analyze-strategic-results.py')
+OPTIONAL_DEPENDENCIES = ('ijson', 'orjson', 'ahocorasick', 'numpy', 'numba')
+RAW_DATA_SECTION = re.compile(r"## RAW DATA DISTRIBUTION\n\n.*?\n\n", re.DOTALL)
+
+@pytest.fixture(scope='session', autouse=True)
+def numba_cache_dir(tmp_path_factory):
+    """Keep any numba cache out of the source tree, for this process and its children."""
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv('NUMBA_CACHE_DIR', str(tmp_path_factory.mktemp('numba-cache')))
+        yield
+
+def bench(name, score, raw_data=None):
+    metric = {'score': score, 'scoreUnit': 'ns/op'}
+    if raw_data is not None:
+        metric['rawData'] = raw_data
+    return {'benchmark': f'io.github.yasmramos.veld.benchmark.Strategic.{name}', 'primaryMetric': metric}
+
+def write_results(results_dir):
+    """Write the six category files, mixing both JMH layouts and one truncated file."""
+    results_dir.mkdir()
+    wrapped = {
+        'scalability': [bench('unrelated', 1.0, [[1.0, 2.0]]),
+                        bench('concurrentLookup', 400.0, [[390.0, 410.0], [400.0, 400.0]]),
+                        bench('singleThreadLookup', 110.0)],
+        'memory': [bench('memoryOverhead', 3 * 1024 * 1024.0)],
+        'load-factor': [bench('loadFactorValidation', 0.65)]
+    }
+    bare = {
+        'contention': [bench('getLazyService', 850.0)],
+        'efficiency': [bench('concurrentEfficiency', 300.0), bench('singleEfficiency', 100.0)]
+    }
+    for name, benchmarks in wrapped.items():
+        (results_dir / f'{name}-results.json').write_text(json.dumps({'benchmarks': benchmarks}))
+    for name, benchmarks in bare.items():
+        (results_dir / f'{name}-results.json').write_text(json.dumps(benchmarks, indent=4))
+    # The needed record comes before the damage
+    truncated = json.dumps({'benchmarks': [bench('worstCaseHashCollision', 1.0)]})[:-2] + ', {"bench'
+    (results_dir / 'hash-collision-results.json').write_text(truncated)
+
+def load_script(monkeypatch, blocked):
+    for name in blocked:
+        monkeypatch.setitem(sys.modules, name, None)
+    spec = importlib.util.spec_from_file_location('analyze_strategic_results', SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    # Register under a real name, so nothing it compiles refers to '<dynamic>'
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+    return module
+
+def run_analysis(monkeypatch, tmp_path, blocked):
+    with monkeypatch.context() as patch:
+        module = load_script(patch, blocked)
+        # Send every rawData array through the numba kernel when numba is available
+        module.NUMBA_MIN_SAMPLES = 1
+        results_dir = tmp_path / ('results-' + '-'.join(blocked or ('none',)))
+        write_results(results_dir)
+        results, passed, total = module.StrategicBenchmarkAnalyzer().run_analysis(str(results_dir))
+    verdicts = {category: result and result.status for category, result in results.items()}
+    report = (results_dir / 'strategic-analysis-report.md').read_text(encoding='utf-8')
+    report = '\n'.join(line for line in report.splitlines() if not line.startswith('Generated:'))
+    return verdicts, passed, total, report
+
+def test_baseline_verdicts(monkeypatch, tmp_path):
+    verdicts, passed, total, report = run_analysis(monkeypatch, tmp_path, ())
+
+    assert verdicts == {
+        'scalability': 'PASS',
+        'contention': 'PASS',
+        'memory': 'PASS',
+        'hash_collision': None,
+        'efficiency': 'FAIL',
+        'load_factor': 'PASS'
+    }
+    assert (passed, total) == (4, 5)
+    assert '**concurrentLookup:** mean 400.000, min 390.000, max 410.000' in report
+    assert 'unrelated' not in report
+
+@pytest.mark.parametrize('blocked', [(name,) for name in OPTIONAL_DEPENDENCIES] + [OPTIONAL_DEPENDENCIES],
+                         ids=lambda blocked: '+'.join(blocked))
+def test_results_match_without_optional_dependency(monkeypatch, tmp_path, capsys, blocked):
+    expected = run_analysis(monkeypatch, tmp_path, ())
+    actual = run_analysis(monkeypatch, tmp_path, blocked)
+
+    if 'numpy' in blocked:
+        # rawData statistics need numpy, the verdicts and remaining report must not
+        assert 'RAW DATA DISTRIBUTION' not in actual[3]
+        expected = expected[:3] + (RAW_DATA_SECTION.sub('', expected[3]),)
+    assert actual == expected
+    assert capsys.readouterr().out.count('Warning: Invalid JSON') == 2
+
+def test_repeated_runs_with_large_raw_data(monkeypatch, tmp_path):
+    """A dynamically loaded run followed by script runs must not trip over leftover numba state."""
+    pytest.importorskip('numpy')
+    pytest.importorskip('numba')
+    results_dir = tmp_path / 'results'
+    write_results(results_dir)
+    with monkeypatch.context() as patch:
+        module = load_script(patch, ())
+        samples = [[400.0] * module.NUMBA_MIN_SAMPLES]
+        large = [bench('concurrentLookup', 400.0, samples), bench('singleThreadLookup', 110.0)]
+        (results_dir / 'scalability-results.json').write_text(json.dumps(large))
+        module.StrategicBenchmarkAnalyzer().run_analysis(str(results_dir))
+
+    for _ in range(2):
+        completed = subprocess.run([sys.executable, str(SCRIPT)], cwd=tmp_path, env=os.environ.copy(),
+                                   capture_output=True, text=True, encoding='utf-8')
+        assert 'Traceback' not in completed.stderr
+        assert '1 critical tests failed' in completed.stdout
+        report = (results_dir / 'strategic-analysis-report.md').read_text(encoding='utf-8')
+        assert '**concurrentLookup:** mean 400.000, min 400.000, max 400.000' in report
+
+@pytest.mark.parametrize('blocked', [(), ('ahocorasick',)], ids=['automaton', 'substring'])
+def test_repeated_benchmark_names_keep_baseline_match(monkeypatch, tmp_path, blocked):
+    """JMH repeats a name per @Param; pairs of benchmarks use the last record, single ones the first."""
+    results_dir = tmp_path / 'results'
+    write_results(results_dir)
+    (results_dir / 'scalability-results.json').write_text(json.dumps([
+        bench('concurrentLookup', 100.0), bench('singleThreadLookup', 110.0), bench('concurrentLookup', 900.0)
+    ]))
+    (results_dir / 'contention-results.json').write_text(json.dumps([
+        bench('getLazyService', 850.0), bench('getLazyService', 5000.0)
+    ]))
+    with monkeypatch.context() as patch:
+        module = load_script(patch, blocked)
+        results, _, _ = module.StrategicBenchmarkAnalyzer().run_analysis(str(results_dir))
+
+    assert results['scalability'].concurrent_avg_ns == 900.0
+    assert results['contention'].avg_lazy_lookup_ns == 850.0